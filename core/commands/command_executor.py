@@ -3,9 +3,11 @@ Command Executor - Safe shell command execution
 Uses list[str] instead of shell strings for security
 """
 
+import functools
 import subprocess
 import os
 import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, Callable
@@ -15,11 +17,15 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def find_git_path() -> Optional[str]:
     """
     Find git executable path automatically.
     Searches common installation locations on Windows.
     
+    The result is cached for the session; call find_git_path.cache_clear()
+    to search again (e.g. after installing Git).
+    
     Returns:
         Path to git bin directory, or None if not found
     """
@@ -70,6 +76,35 @@ def find_git_path() -> Optional[str]:
     return None
 
 
+# A "git not found" result is looked up again after this many seconds
+GIT_RECHECK_SECONDS = 60
+# When find_git_path() last came back empty (None = found, or not looked up yet)
+_git_missing_since: Optional[float] = None
+_git_lookup_lock = threading.Lock()
+
+
+def lookup_git_path() -> Optional[str]:
+    """
+    find_git_path(), but a miss doesn't stick for the whole session.
+    
+    A found path is kept forever; a miss is searched again at most every
+    GIT_RECHECK_SECONDS, so installing Git doesn't need a restart.
+    """
+    global _git_missing_since
+    with _git_lookup_lock:
+        git_path = find_git_path()
+        if git_path:
+            return git_path
+        now = time.monotonic()
+        if _git_missing_since is None:
+            _git_missing_since = now
+        elif now - _git_missing_since >= GIT_RECHECK_SECONDS:
+            find_git_path.cache_clear()
+            git_path = find_git_path()
+            _git_missing_since = None if git_path else now
+        return git_path
+
+
 class CommandStatus(Enum):
     SUCCESS = "success"
     ERROR = "error"
@@ -372,14 +407,13 @@ class CommandExecutor:
                 f.write("\n".join(script_lines))
                 batch_file = f.name
             
-            # Run the batch file in a new console using 'start'
-            # Use specific command format that handles spaces better
-            cmd_command = f'start "{title}" cmd.exe /c "{batch_file}"'
-            
+            # Run the batch file in its own console. Launching cmd.exe directly
+            # (instead of shell=True + 'start') skips a whole cmd.exe process;
+            # the window title is set by the script itself.
             subprocess.Popen(
-                cmd_command,
-                shell=True,
-                env=os.environ.copy()
+                ["cmd.exe", "/c", batch_file],
+                env=os.environ.copy(),
+                creationflags=subprocess.CREATE_NEW_CONSOLE
             )
             
             logger.info(f"Interactive terminal started with {len(commands)} commands")
@@ -20,9 +20,17 @@ class ConfigManager:
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self._config: dict = {}
+        # Bumped on every load/save so callers can cache derived values
+        self._revision = 0
+    
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever the configuration is loaded or modified"""
+        return self._revision
     
     def load(self) -> dict:
         """Load configuration from file"""
+        self._revision += 1
         if not self.config_path.exists():
             logger.warning(f"Config file not found: {self.config_path}")
             self._config = self._get_default_config()
@@ -45,6 +53,8 @@ class ConfigManager:
     
     def save(self) -> bool:
         """Save configuration to file"""
+        # Every mutation goes through save()
+        self._revision += 1
         try:
             # Ensure directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -210,10 +220,11 @@ class ConfigManager:
         
         # Find project in list
         projects = self.get_projects(key) # This returns expanded projects
+        target = Path(expanded_active_path).resolve()
         for p in projects:
             # Simple string comparison should work as both are expanded, 
             # but resolve is safer
-            if Path(p["path"]).resolve() == Path(expanded_active_path).resolve():
+            if Path(p["path"]).resolve() == target:
                 return p
         
         # Fallback if not found in list but active path is set
@@ -222,6 +233,19 @@ class ConfigManager:
              
         return None
     
+    def get_active_projects(self, keys: "list[str] | tuple[str, ...]") -> dict[str, dict]:
+        """Get the active projects for several features at once (keys without one are omitted)"""
+        saved_paths = self._config.get("saved_paths", {})
+        actives = {}
+        for key in keys:
+            # Skip the lookup entirely for features that never had a project set
+            if not saved_paths.get(f"{key}_active"):
+                continue
+            project = self.get_active_project(key)
+            if project:
+                actives[key] = project
+        return actives
+    
     def set_active_project(self, key: str, path: str):
         """Set the active project"""
         if "saved_paths" not in self._config:
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
+from utils.dialog_client import run_dialog_once
 from utils.logger import get_logger
 import webbrowser
 
@@ -163,47 +164,8 @@ class AIAssistantFeature(BaseFeature):
             )
     
     def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import subprocess
-        import sys
-        import json
-        from pathlib import Path
-        
-        # Point to ui/dialogs.py relative to this file
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        
-        try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
-
-            # Run without window creation flag on Windows if possible, but keep simple for now
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
+        """Helper to run dialog subprocess (payload goes over stdin, not argv)"""
+        return run_dialog_once(command, data)
 
     def _show_ai_menu_async(self) -> FeatureResult:
         """Show AI menu"""
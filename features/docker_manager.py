@@ -2,18 +2,66 @@
 Docker Manager Feature - Manage Docker Compose projects
 """
 
+import os
+import functools
 import threading
 import subprocess
-import sys
-import json
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
+from utils.dialog_client import DialogClient, show_notification
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Docker menu entries - index order is what _show_docker_menu dispatches on
+_MENU_OPTIONS = (
+    "🚀 Docker Up",
+    "🛑 Docker Down",
+    "🔄 Restart",
+    "📊 Status (ps)",
+    "🔍 View Service Logs",
+    "📂 Select Project",
+    "🧹 System Prune (Danger)",
+)
+
+# Compose file names in the order docker compose itself looks for them
+COMPOSE_FILE_NAMES = ("compose.yaml", "compose.yml", "docker-compose.yaml", "docker-compose.yml")
+
+# bash commands run through wsl.exe. Chained with && and || rather than ';'
+# because wt.exe splits its command line at semicolons; 'exec bash' keeps
+# the window open afterwards.
+_KEEP_OPEN_TMPL = "{inner} && exec bash || exec bash"
+_PRUNE_CMD = (
+    "docker system prune -a --force"
+    ' && echo -e "\n✅ Prune Complete" && read -p "Press Enter to close..."'
+    ' || read -p "Failed..."'
+)
+_SERVICES_CMD = "docker compose config --services"
+# Seconds to wait for the service list (a cold WSL start alone can take several)
+SERVICES_TIMEOUT = 20
+
+
+@functools.lru_cache(maxsize=1)
+def _wt_path() -> str | None:
+    """Locate Windows Terminal once (shutil.which stats every PATH entry)"""
+    import shutil
+    return shutil.which("wt")
+
+
+def _find_compose(path: Path) -> Path | None:
+    """Return the compose file in a directory, or None (one directory scan instead of a stat per name)"""
+    try:
+        with os.scandir(path) as it:
+            names = {entry.name for entry in it if not entry.is_dir()}
+    except OSError:
+        # Missing or unreadable directory
+        return None
+    for name in COMPOSE_FILE_NAMES:
+        if name in names:
+            return path / name
+    return None
 
 class DockerManagerFeature(BaseFeature):
     """
@@ -28,32 +76,43 @@ class DockerManagerFeature(BaseFeature):
     supported_patterns = [PressType.SHORT, PressType.LONG]
     
     CONFIG_KEY = "docker_project"
-    _is_dialog_open = False
+    # Other features whose active project may hold a docker-compose.yml
+    FALLBACK_KEYS = ("terminal_project", "frontend_project", "git_project")
+    # Dialogs block while on screen, so they run on one reused pool thread
+    # (only one dialog is allowed at a time, so a second worker would sit idle)
+    _dialog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docker-dlg")
+    # Held from the moment a dialog is queued until it closes
+    _dialog_lock = threading.Lock()
+    
+    def __init__(self, config_manager, command_executor):
+        super().__init__(config_manager, command_executor)
+        # project path -> (compose file mtime_ns, service names)
+        self._services_cache: dict[Path, tuple[int, list[str]]] = {}
     
     def execute(self, event: InputEvent, action: str) -> FeatureResult:
         """Execute docker action"""
         
-        if self._is_dialog_open and action == "select":
+        if self._dialog_lock.locked() and action == "select":
              return FeatureResult(
                 status=FeatureStatus.CANCELLED,
                 message="Dialog already open"
             )
 
+        if action == "select":
+             return self._show_project_selector_async()
+             
         # Get active project or ask to select
         active_project = self._get_or_select_project()
-        if not active_project and action != "select":
-             if self._is_dialog_open:
+        if not active_project:
+             if self._dialog_lock.locked():
                  return FeatureResult(status=FeatureStatus.SUCCESS, message="Selecting project...")
              return FeatureResult(status=FeatureStatus.CANCELLED, message="No project selected")
 
-        if action == "select":
-             return self._show_project_selector_async()
-             
         # If we are here, we have a project path
         project_path = active_project
         
         if action == "menu":
-            return self._show_docker_menu_async()
+            return self._show_docker_menu_async(project_path)
         
         # Actions that require run
         if action == "compose_up":
@@ -78,12 +137,14 @@ class DockerManagerFeature(BaseFeature):
         """Normalize path string to proper Path object"""
         if not path_str:
             return None
-        import os
         try:
-            # Expand vars like %USERPROFILE%
-            expanded = os.path.expandvars(path_str)
-            normalized = expanded.replace('/', '\\')
-            path = Path(normalized)
+            if "%" in path_str or "$" in path_str or "/" in path_str:
+                # Expand vars like %USERPROFILE%
+                expanded = os.path.expandvars(path_str)
+                path = Path(expanded.replace('/', '\\'))
+            else:
+                # Already a plain Windows path (the common case)
+                path = Path(path_str)
             if path.exists():
                 return path.resolve()
             return path
@@ -101,49 +162,48 @@ class DockerManagerFeature(BaseFeature):
                 return path
                 
         # Fallback to other active projects if they contain docker-compose.yml
-        for key in ["terminal_project", "frontend_project", "git_project"]:
-            p = self.config_manager.get_active_project(key)
-            if p:
-                path = self._normalize_path(p.get("path", ""))
-                if path and path.exists() and (path / "docker-compose.yml").exists():
-                    logger.info(f"Found docker-compose in {key}: {path}")
-                    return path
+        fallbacks = self.config_manager.get_active_projects(self.FALLBACK_KEYS)
+        for key, p in fallbacks.items():
+            path = self._normalize_path(p.get("path", ""))
+            if path and _find_compose(path):
+                logger.info(f"Found docker-compose in {key}: {path}")
+                return path
 
         # No active project found, show selector
         # Only show selector if we are NOT already in a dialog (like menu)
         # to avoid confusing user or double-dialogs
-        if not self._is_dialog_open:
+        if not self._dialog_lock.locked():
             self._show_project_selector_async()
             
     def _run_terminal_command(self, path_str: str, wsl_command: str = None, cmd_command: str = None) -> bool:
-        """Helper to run a terminal command in a new window (preferring Windows Terminal)"""
+        """
+        Helper to run a terminal command in a new window (preferring Windows Terminal)
+        
+        wsl_command is a bash command line, cmd_command a cmd.exe one. Both are
+        passed as a single argv entry, so no shell has to re-parse them.
+        """
         try:
-            wt_path = shutil.which("wt")
+            wt_path = _wt_path()
             
-            # Escape inner quotes for command arguments
             if wsl_command:
-                # wsl_command is something like: -e bash -c "..."
-                # We need to be careful with escaping
-                pass 
+                shell_argv = ["wsl.exe", "--cd", path_str, "-e", "bash", "-c", wsl_command]
+            else:
+                shell_argv = ["cmd.exe", "/k", cmd_command]
                 
             if wt_path:
-                if wsl_command:
-                     # wt.exe -d "path" -- wsl.exe [args]
-                     cmd_str = f'wt.exe -d "{path_str}" -- wsl.exe {wsl_command}'
-                else:
-                     # wt.exe -d "path" cmd /k "..."
-                     cmd_str = f'wt.exe -d "{path_str}" cmd /k "{cmd_command}"'
-                
-                subprocess.Popen(cmd_str, shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                # wt.exe -d "path" -- <shell argv>
+                subprocess.Popen(
+                    [wt_path, "-d", path_str, "--", *shell_argv],
+                    creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+                )
             else:
-                if wsl_command:
-                    # Direct wsl
-                    cmd_str = f'start wsl.exe --cd "{path_str}" {wsl_command}'
-                else:
-                    # Direct cmd
-                    cmd_str = f'start cmd /k "cd /d {path_str} && {cmd_command}"'
-                
-                subprocess.Popen(cmd_str, shell=True)
+                # Launch the shell directly in its own console instead of going
+                # through 'start' (saves a cmd.exe layer and its quoting rules)
+                subprocess.Popen(
+                    shell_argv,
+                    cwd=path_str,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                )
             return True
         except Exception as e:
             logger.error(f"Failed to launch terminal: {e}")
@@ -151,7 +211,7 @@ class DockerManagerFeature(BaseFeature):
 
     def _run_compose(self, project_path: Path, args: str, title: str) -> FeatureResult:
         """Run docker-compose command"""
-        if not (project_path / "docker-compose.yml").exists() and not (project_path / "docker-compose.yaml").exists():
+        if not _find_compose(project_path):
              return FeatureResult(
                 status=FeatureStatus.ERROR,
                 message="No docker-compose.yml found"
@@ -162,36 +222,62 @@ class DockerManagerFeature(BaseFeature):
         
         logger.info(f"Running: {docker_cmd} in {path_str}")
         
-        # Use && and || to avoid semicolon issue in wt.exe
-        wsl_args = f'-e bash -c "{docker_cmd} && exec bash || exec bash"'
+        wsl_cmd = _KEEP_OPEN_TMPL.format(inner=docker_cmd)
         
-        if self._run_terminal_command(path_str, wsl_command=wsl_args):
+        if self._run_terminal_command(path_str, wsl_command=wsl_cmd):
             return FeatureResult(status=FeatureStatus.SUCCESS, message=f"Executed {title}")
         else:
             return FeatureResult(status=FeatureStatus.ERROR, message=f"Failed: {title}")
 
     def _get_docker_services(self, project_path: Path) -> list[str]:
-        """Get list of services from docker-compose"""
+        """Get list of services from docker-compose (cached until the compose file changes)"""
+        compose_file = _find_compose(project_path)
+        try:
+            compose_mtime = compose_file.stat().st_mtime_ns if compose_file else None
+        except OSError:
+            compose_mtime = None
+            
+        cached = self._services_cache.get(project_path)
+        if cached and compose_mtime is not None and cached[0] == compose_mtime:
+            return cached[1]
+            
+        services = self._list_docker_services(project_path)
+        if services and compose_mtime is not None:
+            self._services_cache[project_path] = (compose_mtime, services)
+        return services
+
+    def _list_docker_services(self, project_path: Path) -> list[str]:
+        """Ask docker compose for the project's services"""
         path_str = str(project_path)
         try:
              # Run docker compose config --services to get list
              # Use wsl if on windows and not using docker desktop natively?
              # Assuming wsl environment as established
              
-             cmd = f'wsl.exe --cd "{path_str}" -e bash -c "docker compose config --services"'
+             cmd = ["wsl.exe", "--cd", path_str, "-e", "bash", "-c", _SERVICES_CMD]
              
-             result = subprocess.run(
-                 cmd, 
-                 capture_output=True, 
-                 text=True, 
+             # Only stdout is piped: with a single pipe communicate() just reads
+             # it to EOF instead of starting a reader thread per pipe
+             proc = subprocess.Popen(
+                 cmd,
+                 stdout=subprocess.PIPE,
+                 stderr=subprocess.DEVNULL,
                  creationflags=subprocess.CREATE_NO_WINDOW
              )
+             try:
+                 out, _ = proc.communicate(timeout=SERVICES_TIMEOUT)
+             except subprocess.TimeoutExpired:
+                 proc.kill()
+                 proc.communicate()
+                 logger.error(f"Timed out listing services after {SERVICES_TIMEOUT}s")
+                 return []
              
-             if result.returncode == 0:
-                 services = [s.strip() for s in result.stdout.splitlines() if s.strip()]
-                 return services
+             if proc.returncode == 0:
+                 # One name per line; service names can't contain whitespace,
+                 # so a bytes split() also drops blank lines and stray \r
+                 return [s.decode("utf-8", "replace") for s in out.split()]
              else:
-                 logger.error(f"Failed to get services: {result.stderr}")
+                 logger.error(f"Failed to get services (exit code {proc.returncode})")
                  return []
         except Exception as e:
             logger.error(f"Error getting services: {e}")
@@ -226,53 +312,57 @@ class DockerManagerFeature(BaseFeature):
             docker_cmd = "docker compose logs -f --tail 100"
             msg = "Opening all logs..."
         
-        # Use && and || to ensure bash runs after (keeps window open), preventing 'wt' from splitting at semicolon
-        wsl_args = f'-e bash -c "{docker_cmd} && exec bash || exec bash"'
+        wsl_cmd = _KEEP_OPEN_TMPL.format(inner=docker_cmd)
         
         # Consistent with _run_compose, run in WSL
-        if self._run_terminal_command(path_str, wsl_command=wsl_args):
+        if self._run_terminal_command(path_str, wsl_command=wsl_cmd):
             return FeatureResult(status=FeatureStatus.SUCCESS, message=msg)
         else:
             return FeatureResult(status=FeatureStatus.ERROR, message="Failed to open logs")
 
-    def _show_docker_menu_async(self) -> FeatureResult:
-        """Show docker menu in separate thread"""
+    def _submit_dialog(self, target, *args) -> bool:
+        """
+        Run a dialog on the worker pool. Returns False if one is already open or queued.
+        
+        The dialog lock is taken here rather than when the task starts, so two
+        quick presses can't both get a dialog queued; the task releases it.
+        """
+        if not self._dialog_lock.acquire(blocking=False):
+            return False
+            
         def run_dialog():
-            self._is_dialog_open = True
             try:
-                self._show_docker_menu()
+                target(*args)
+            except Exception as e:
+                # The future is never read, so log here or the error is lost
+                logger.error(f"Docker dialog task failed: {e}")
             finally:
-                self._is_dialog_open = False
-        import threading
-        threading.Thread(target=run_dialog, daemon=True).start()
+                self._dialog_lock.release()
+        self._dialog_executor.submit(run_dialog)
+        return True
+
+    def _show_docker_menu_async(self, active_project: Path) -> FeatureResult:
+        """Show docker menu in separate thread"""
+        if not self._submit_dialog(self._show_docker_menu, active_project):
+            return FeatureResult(status=FeatureStatus.CANCELLED, message="Dialog already open")
         return FeatureResult(status=FeatureStatus.SUCCESS, message="Opening Docker menu...")
 
-    def _show_docker_menu(self):
-        """Show docker actions menu"""
+    def _show_docker_menu(self, active: Path = None):
+        """Show docker actions menu (resolves the project only if not given)"""
         try:
-            active = self._get_or_select_project()
-            
+            if active is None:
+                active = self._get_or_select_project()
+                
             # Friendly project display
             if active:
                 project_display = f"▸ Working on: {active.name}"
             else:
                 project_display = "⚠ No project selected"
             
-            options = [
-                "🚀 Docker Up",
-                "🛑 Docker Down", 
-                "🔄 Restart",
-                "📊 Status (ps)",
-
-                "🔍 View Service Logs",
-                "📂 Select Project",
-                "🧹 System Prune (Danger)"
-            ]
-            
             result_data = self._run_dialog_subprocess("ask_choice", {
                 "title": "Docker Menu",
                 "message": f"{project_display}\n\nWhat would you like to do?",
-                "choices": options
+                "choices": _MENU_OPTIONS
             })
             
             if not result_data:
@@ -300,8 +390,11 @@ class DockerManagerFeature(BaseFeature):
                 self._select_service_and_open_logs(active)
             elif choice_idx == 5: # Select
                 if self._show_project_selector():
-                    # Re-open menu with new project
-                    self._show_docker_menu()
+                    # Re-open menu with the project that was just selected
+                    # (no need to re-scan the fallback keys)
+                    selected = self.config_manager.get_active_project(self.CONFIG_KEY)
+                    new_active = self._normalize_path(selected.get("path", "")) if selected else None
+                    self._show_docker_menu(new_active)
             elif choice_idx == 6: # Prune
                 self._prune_system(active)
         except Exception as e:
@@ -330,39 +423,32 @@ class DockerManagerFeature(BaseFeature):
                 
             # 2. Execute
             # Use active project path if available, else user profile
-            import os
             path = str(active_project) if active_project else os.path.expandvars("%USERPROFILE%")
             
-            docker_cmd = "docker system prune -a --force"
-            wsl_args = f'-e bash -c "{docker_cmd} && echo -e \\"\n✅ Prune Complete\\" && read -p \\"Press Enter to close...\\" || read -p \\"Failed...\\""'
-            
-            self._run_terminal_command(path, wsl_args)
+            self._run_terminal_command(path, wsl_command=_PRUNE_CMD)
         except Exception as e:
             logger.error(f"Prune error: {e}")
             self._run_notification_subprocess("❌ Prune Error", str(e))
 
     def _show_project_selector_async(self) -> FeatureResult:
-        def run_dialog():
-            self._is_dialog_open = True
-            try:
-                self._show_project_selector()
-            finally:
-                self._is_dialog_open = False
-        threading.Thread(target=run_dialog, daemon=True).start()
+        """Show project selector in separate thread"""
+        if not self._submit_dialog(self._show_project_selector):
+            return FeatureResult(status=FeatureStatus.CANCELLED, message="Dialog already open")
         return FeatureResult(status=FeatureStatus.SUCCESS, message="Select Project...")
 
     def _show_project_selector(self) -> bool:
         """Show project selector using subprocess. Returns True if a project was selected/added."""
         
-        # Gather projects similar to before
-        all_projects = []
-        docker_projects = self.config_manager.get_projects(self.CONFIG_KEY)
-        all_projects.extend(docker_projects)
-        
-        for key in ["frontend_project", "git_project"]:
+        # Gather docker projects first, then the other features' projects.
+        # Keyed by normalized path so "C:/x" and "c:\\x\\" count as one entry.
+        def path_key(p):
+            return os.path.normcase(os.path.normpath(p["path"]))
+            
+        seen: dict[str, dict] = {}
+        for key in (self.CONFIG_KEY, "frontend_project", "git_project"):
             for p in self.config_manager.get_projects(key):
-                if not any(x["path"] == p["path"] for x in all_projects):
-                    all_projects.append(p)
+                seen.setdefault(path_key(p), p)
+        all_projects = list(seen.values())
                     
         result_data = self._run_dialog_subprocess("ask_project_selection", {
             "projects": all_projects,
@@ -403,62 +489,9 @@ class DockerManagerFeature(BaseFeature):
         return False
             
     def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import sys
-        
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
-
-            # Run without window creation flag on Windows
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8', 
-                errors='replace'
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
+        """Helper to run a dialog through the shared dialog process"""
+        return DialogClient.get().call(command, data)
 
     def _run_notification_subprocess(self, title, message):
-        """Helper to show notification via subprocess"""
-        # Fire and forget
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        data = json.dumps({
-            "title": title,
-            "message": message,
-            "duration": 2000
-        })
-        try:
-             is_frozen = getattr(sys, 'frozen', False)
-             if is_frozen:
-                 cmd = [sys.executable, "dialog", "show_notification", data]
-             else:
-                 cmd = [sys.executable, str(dialog_script), "show_notification", data]
-                 
-             subprocess.Popen(
-                cmd,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-        except:
-            pass
+        """Helper to show a notification (fire and forget)"""
+        show_notification(title, message, duration=2000)
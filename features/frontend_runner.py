@@ -8,16 +8,28 @@ Actions:
 - reset_path: Reset and manage projects (triggered by multi-press)
 """
 
+import os
+import queue
+import sys
 import threading
 from pathlib import Path
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
-from utils.project_detector import get_dev_command
+from utils.dialog_client import run_dialog_once, show_notification
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+if sys.platform == "win32":
+    def _path_exists(path) -> bool:
+        """Existence check without a full stat (GetFileAttributesW instead of opening the file)"""
+        return os.access(path, os.F_OK)
+else:
+    # access() gains nothing over stat() elsewhere and can be slower under SELinux
+    _path_exists = os.path.exists
+
+
 class FrontendRunnerFeature(BaseFeature):
     """
     Feature 2: Frontend Project Runner with Multi-Project Support
@@ -32,94 +44,133 @@ class FrontendRunnerFeature(BaseFeature):
     supported_patterns = [PressType.SHORT, PressType.LONG, PressType.MULTI]
     
     CONFIG_KEY = "frontend_project"
-    _is_dialog_open = False
+    TERMINAL_TITLE_PREFIX = "Dev Server - "
+    STARTED_TITLE = "▶️ Dev Server Started"
+    # Notifications arriving within this many seconds are shown as one
+    NOTIFY_COALESCE_SECONDS = 0.3
+    # All dialog work runs on one long-lived worker thread
+    _worker_queue: "queue.Queue" = queue.Queue()
+    _worker: threading.Thread | None = None
+    # Held from the moment a dialog is queued until it closes
+    _dialog_lock = threading.Lock()
+    
+    def __init__(self, config_manager, command_executor):
+        super().__init__(config_manager, command_executor)
+        cls = type(self)
+        if cls._worker is None:
+            cls._worker = threading.Thread(target=cls._worker_loop, name="frontend-worker", daemon=True)
+            cls._worker.start()
+        # (config revision, resolved active project folder)
+        self._active_cache: tuple[int, Path] | None = None
+        # (config revision, saved projects) - shared list, don't mutate
+        self._projects_cache: tuple[int, list[dict]] | None = None
+        # project path -> (package.json mtime_ns, detected dev command)
+        self._dev_cmd_cache: dict[Path, tuple[int, list[str] | None]] = {}
+        self._pending_notifs: list[tuple[str, str]] = []
+        self._notif_timer: threading.Timer | None = None
+        self._notif_lock = threading.Lock()
+        # action name -> handler
+        self._actions = {
+            "run_dev": self._run_dev_server,
+            "select": self._show_project_selector_async,
+            "reset_path": self._show_project_selector_async,
+            "menu": self._show_dev_menu_async,
+        }
     
     def execute(self, event: InputEvent, action: str) -> FeatureResult:
         """Execute the run_dev or reset_path action"""
         
         # Prevent multiple dialogs
-        if self._is_dialog_open:
+        if self._dialog_lock.locked():
             logger.warning("Dialog already open, ignoring request")
             return FeatureResult(
                 status=FeatureStatus.CANCELLED,
                 message="Dialog already open"
             )
         
-        if action == "run_dev":
-            return self._run_dev_server()
-        elif action == "select":
-            return self._show_project_selector_async()
-        elif action == "reset_path":
-            return self._show_project_selector_async()
-        elif action == "menu":
-            return self._show_dev_menu_async()
-        else:
-            return FeatureResult(
-                status=FeatureStatus.ERROR,
-                message=f"Unknown action: {action}"
-            )
+        handler = self._actions.get(action)
+        if handler:
+            return handler()
+        return FeatureResult(
+            status=FeatureStatus.ERROR,
+            message=f"Unknown action: {action}"
+        )
     
-    def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import subprocess
-        import sys
-        import json
-        from pathlib import Path
-        
-        # Point to ui/dialogs.py relative to this file
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        
-        try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
+    @classmethod
+    def _worker_loop(cls):
+        """Run queued dialog tasks one at a time"""
+        while True:
+            task = cls._worker_queue.get()
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"Frontend dialog task failed: {e}")
 
-            # Run without window creation flag on Windows if possible, but keep simple for now
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8',
-                errors='replace'
-            )
+    def _submit(self, target) -> bool:
+        """
+        Queue a dialog task. Returns False if a dialog is already open or queued.
+        
+        The dialog lock is taken here rather than when the task starts, so two
+        quick presses can't both get a dialog queued; the worker releases it.
+        """
+        if threading.current_thread() is self._worker:
+            # Already on the dialog thread (e.g. "Run Dev Server" picked from
+            # the menu needs the selector): run it right away
+            target()
+            return True
+            
+        if not self._dialog_lock.acquire(blocking=False):
+            return False
             
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
-
-    def _show_notification_async(self, title: str, message: str):
-        """Show notification via subprocess"""
-        self._run_dialog_subprocess("show_notification", {
-            "title": title,
-            "message": message,
-            "duration": 2000
-        })
-
-    def _show_dev_menu_async(self) -> FeatureResult:
-        """Show the development menu in a separate thread"""
         def run_dialog():
-            self._is_dialog_open = True
             try:
-                self._show_dev_menu()
+                target()
             finally:
-                self._is_dialog_open = False
+                self._dialog_lock.release()
+        self._worker_queue.put(run_dialog)
+        return True
+
+    def _run_dialog_subprocess(self, command, data):
+        """Helper to run dialog subprocess"""
+        return run_dialog_once(command, data)
+
+    def _show_notification_async(self, title: str, message: str):
+        """Show notification (fire and forget)"""
+        show_notification(title, message, duration=2000)
+
+    def _notify(self, title: str, message: str):
+        """Queue a notification; bursts (e.g. removing several projects) become one toast"""
+        with self._notif_lock:
+            self._pending_notifs.append((title, message))
+            if self._notif_timer:
+                self._notif_timer.cancel()
+            self._notif_timer = threading.Timer(self.NOTIFY_COALESCE_SECONDS, self._flush_notifications)
+            self._notif_timer.daemon = True
+            self._notif_timer.start()
+
+    def _flush_notifications(self):
+        """Show everything queued by _notify as a single notification"""
+        with self._notif_lock:
+            pending, self._pending_notifs = self._pending_notifs, []
+            self._notif_timer = None
+        if not pending:
+            return
         
-        threading.Thread(target=run_dialog, daemon=True).start()
+        if len({title for title, _ in pending}) == 1:
+            title = pending[0][0]
+            message = "\n".join(msg for _, msg in pending)
+        else:
+            title = pending[-1][0]
+            message = "\n".join(f"{t} {msg}" for t, msg in pending)
+        self._show_notification_async(title, message)
+
+    def _show_dev_menu_async(self) -> FeatureResult:
+        """Show the development menu on the worker thread"""
+        if not self._submit(self._show_dev_menu):
+            return FeatureResult(
+                status=FeatureStatus.CANCELLED,
+                message="Dialog already open"
+            )
         
         return FeatureResult(
             status=FeatureStatus.SUCCESS,
@@ -170,35 +221,53 @@ class FrontendRunnerFeature(BaseFeature):
         """Normalize path string to proper Path object - handles all formats"""
         if not path_str:
             return None
-        import os
         try:
-            expanded = os.path.expandvars(path_str)
-            # Replace forward slashes with backslashes for Windows consistency
-            normalized = expanded.replace('/', '\\')
-            path = Path(normalized)
-            
-            # Resolve to get absolute path with consistent format
-            if path.exists():
-                return path.resolve()
-            return path
+            # Saved paths are canonicalized when they are added and expanded
+            # by the config manager, so only leftover variables need handling
+            if "%" in path_str or "$" in path_str:
+                path_str = os.path.expandvars(path_str)
+            return Path(path_str)
         except Exception as e:
             logger.error(f"Path normalization failed for '{path_str}': {e}")
             return None
 
+    def _get_active_path(self) -> Path | None:
+        """Resolved active project folder, cached until the config changes"""
+        revision = self.config_manager.revision
+        if self._active_cache and self._active_cache[0] == revision:
+            return self._active_cache[1]
+        
+        active = self.config_manager.get_active_project(self.CONFIG_KEY)
+        if not active:
+            return None
+        project_path = self._normalize_path(active.get("path", ""))
+        if not (project_path and os.path.isdir(project_path)):
+            return None
+        
+        # Only cache a usable folder, so a missing one is re-checked next time
+        self._active_cache = (revision, project_path)
+        return project_path
+
+    def _get_projects(self) -> list[dict]:
+        """Saved projects, cached until the config changes (get_projects resolves every path)"""
+        revision = self.config_manager.revision
+        if self._projects_cache and self._projects_cache[0] == revision:
+            return self._projects_cache[1]
+        projects = self.config_manager.get_projects(self.CONFIG_KEY)
+        self._projects_cache = (revision, projects)
+        return projects
+
     def _run_dev_server(self) -> FeatureResult:
         """Run the frontend dev server - quick launch with active project"""
         
         # Get active project first
-        active = self.config_manager.get_active_project(self.CONFIG_KEY)
-        
-        if active:
-            project_path = self._normalize_path(active.get("path", ""))
-            if project_path and project_path.exists():
-                logger.info(f"Using active project: {active.get('name', project_path.name)}")
-                return self._start_dev_server(project_path)
+        project_path = self._get_active_path()
+        if project_path:
+            logger.info(f"Using active project: {project_path.name}")
+            return self._start_dev_server(project_path)
         
         # Get all projects
-        projects = self.config_manager.get_projects(self.CONFIG_KEY)
+        projects = self._get_projects()
         
         if not projects:
             # No projects saved, ask to add one
@@ -207,7 +276,7 @@ class FrontendRunnerFeature(BaseFeature):
         # If only one project, use it directly
         if len(projects) == 1:
             project_path = self._normalize_path(projects[0].get("path", ""))
-            if project_path and project_path.exists():
+            if project_path and os.path.isdir(project_path):
                 self.config_manager.set_active_project(self.CONFIG_KEY, str(project_path))
                 return self._start_dev_server(project_path)
         
@@ -215,25 +284,22 @@ class FrontendRunnerFeature(BaseFeature):
         return self._show_project_selector_async()
     
     def _show_project_selector_async(self) -> FeatureResult:
-        """Show project selection dialog in a separate thread"""
-        
-        def run_dialog():
-            self._is_dialog_open = True
-            try:
-                self._show_project_selector()
-            finally:
-                self._is_dialog_open = False
-        
-        threading.Thread(target=run_dialog, daemon=True).start()
+        """Show project selection dialog on the worker thread"""
+        if not self._submit(self._show_project_selector):
+            return FeatureResult(
+                status=FeatureStatus.CANCELLED,
+                message="Dialog already open"
+            )
         
         return FeatureResult(
             status=FeatureStatus.SUCCESS,
             message="Opening project selector..."
         )
     
-    def _show_project_selector(self) -> bool:
+    def _show_project_selector(self, projects: list[dict] | None = None) -> bool:
         """Show project selection dialog (runs in thread). Returns True if project was selected/added."""
-        projects = self.config_manager.get_projects(self.CONFIG_KEY)
+        if projects is None:
+            projects = self._get_projects()
         
         result_data = self._run_dialog_subprocess("ask_project_selection", {
             "projects": projects,
@@ -255,20 +321,21 @@ class FrontendRunnerFeature(BaseFeature):
             project = result["project"]
             project_path = Path(project["path"])
             
-            if not project_path.exists():
-                self._show_notification_async("❌ Error", f"Path not found: {project_path}")
+            if not _path_exists(project_path):
+                self._notify("❌ Error", f"Path not found: {project_path}")
                 return
             
             # Set as active (don't auto-run, return True to re-open menu)
             self.config_manager.set_active_project(self.CONFIG_KEY, str(project_path))
-            self._show_notification_async("✅ Project Set", project["name"])
+            self._notify("✅ Project Set", project["name"])
             return True
         
         elif action == "add":
-            path = result["path"]
+            # Resolve once here so the saved path never needs it again
+            path = os.path.realpath(result["path"])
             self.config_manager.add_project(self.CONFIG_KEY, path)
             
-            self._show_notification_async("✅ Project Added", f"Added: {Path(path).name}")
+            self._notify("✅ Project Added", f"Added: {Path(path).name}")
             
             # Set as active (don't auto-run, return True to re-open menu)
             project_path = Path(path)
@@ -277,27 +344,25 @@ class FrontendRunnerFeature(BaseFeature):
         
         elif action == "remove":
             project = result["project"]
-            self.config_manager.remove_project(self.CONFIG_KEY, project["path"])
+            if self.config_manager.remove_project(self.CONFIG_KEY, project["path"]):
+                # Drop it from the list we already have instead of reloading
+                projects = [p for p in projects if p["path"] != project["path"]]
+                self._projects_cache = (self.config_manager.revision, projects)
             
-            self._show_notification_async("🗑️ Project Removed", f"Removed: {project['name']}")
+            self._notify("🗑️ Project Removed", f"Removed: {project['name']}")
             
             # Show selector again if there are more projects
-            remaining = self.config_manager.get_projects(self.CONFIG_KEY)
-            if remaining:
-                self._show_project_selector()
+            if projects:
+                self._show_project_selector(projects)
             return False  # Don't re-open menu after remove
 
     def _add_new_project_async(self) -> FeatureResult:
-        """Add a new project (runs in thread)"""
-        
-        def run_dialog():
-            self._is_dialog_open = True
-            try:
-                self._add_new_project()
-            finally:
-                self._is_dialog_open = False
-        
-        threading.Thread(target=run_dialog, daemon=True).start()
+        """Add a new project (runs on the worker thread)"""
+        if not self._submit(self._add_new_project):
+            return FeatureResult(
+                status=FeatureStatus.CANCELLED,
+                message="Dialog already open"
+            )
         
         return FeatureResult(
             status=FeatureStatus.SUCCESS,
@@ -315,24 +380,46 @@ class FrontendRunnerFeature(BaseFeature):
             logger.info("User cancelled folder selection")
             return
             
-        project_path = result.get("path")
+        # Resolve once here so the saved path never needs it again
+        project_path = os.path.realpath(result.get("path"))
         
         # Add to project list
         self.config_manager.add_project(self.CONFIG_KEY, project_path)
         self.config_manager.set_active_project(self.CONFIG_KEY, project_path)
         
-        self._show_notification_async(
+        self._notify(
             "✅ Project Added",
             f"Added: {Path(project_path).name}"
         )
         
         self._start_dev_server(Path(project_path))
     
+    def _get_dev_command(self, project_path: Path) -> list[str] | None:
+        """get_dev_command, cached until package.json changes"""
+        # Imported on first launch rather than when the feature loads
+        from utils.project_detector import get_dev_command
+        
+        try:
+            mtime = os.stat(project_path / "package.json").st_mtime_ns
+        except OSError:
+            # No package.json (or unreadable) - nothing worth caching
+            return get_dev_command(project_path)
+        
+        cached = self._dev_cmd_cache.get(project_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        dev_cmd = get_dev_command(project_path)
+        self._dev_cmd_cache[project_path] = (mtime, dev_cmd)
+        return dev_cmd
+    
     def _start_dev_server(self, project_path: Path) -> FeatureResult:
         """Start the dev server for the given project"""
+        path_str = os.fspath(project_path)
+        project_name = os.path.basename(path_str)
         
         # Detect dev command
-        dev_cmd = get_dev_command(project_path)
+        dev_cmd = self._get_dev_command(project_path)
         
         if not dev_cmd:
             # Default to npm run dev
@@ -345,20 +432,17 @@ class FrontendRunnerFeature(BaseFeature):
         success = self.command_executor.execute_in_terminal(
             command=dev_cmd,
             cwd=project_path,
-            title=f"Dev Server - {project_path.name}",
+            title=self.TERMINAL_TITLE_PREFIX + project_name,
             keep_open=True
         )
         
         if success:
             # Show notification using subprocess to prevent thread conflicts
-            self._show_notification_async(
-                "▶️ Dev Server Started", 
-                f"{project_path.name}"
-            )
+            self._notify(self.STARTED_TITLE, project_name)
             
             return FeatureResult(
                 status=FeatureStatus.SUCCESS,
-                message=f"Dev server started for {project_path.name}"
+                message=f"Dev server started for {project_name}"
             )
         
         return FeatureResult(
@@ -7,15 +7,62 @@ Actions:
 - manage: Manage git projects (add/remove)
 """
 
+import os
+import sys
+import functools
+import subprocess
 import threading
+import time
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+import pyperclip
+from core.commands.command_executor import lookup_git_path
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
+from utils.dialog_client import DialogClient, show_notification
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep git probes from flashing a console window (decided once at import)
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+# AI commit prompts ({diff} = head of the diff)
+AI_PROMPT_TH = """เขียน git commit message สำหรับการเปลี่ยนแปลงนี้
+รูปแบบ: <type>: <ข้อความภาษาไทย>
+Types: feat, fix, docs, refactor, test, chore
+ความยาวไม่เกิน 50 ตัวอักษร
+
+```
+{diff}
+```
+
+ตอบแค่ commit message เท่านั้น"""
+
+AI_PROMPT_EN = """Write a git commit message for these changes.
+Format: <type>: <subject>
+Types: feat, fix, docs, refactor, test, chore
+Keep under 50 chars.
+
+```
+{diff}
+```
+
+Reply with ONLY the commit message."""
+
+# Characters of diff included in the prompt
+AI_PROMPT_DIFF_CHARS = 2500
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_project_path(path_str: str) -> Path:
+    """Expand a saved project path into a Path (parsed once per string)"""
+    expanded = os.path.expandvars(path_str)
+    # Replace forward slashes with backslashes for Windows consistency
+    return Path(expanded.replace('/', '\\'))
+
 
 class GitCommitFeature(BaseFeature):
     """
@@ -31,61 +78,145 @@ class GitCommitFeature(BaseFeature):
     supported_patterns = [PressType.SHORT, PressType.LONG, PressType.MULTI]
     
     CONFIG_KEY = "git_project"
-    _is_dialog_open = False
+    TERMINAL_TITLE_PREFIX = "Git Commit: "
+    COMMITTED_PREFIX = "Committed: "
+    # Bytes of diff kept for the AI prompt (which uses AI_PROMPT_DIFF_CHARS
+    # chars; room for multi-byte UTF-8)
+    DIFF_HEAD_BYTES = 10000
+    # Seconds before a hung git probe is given up on (e.g. a stalled network drive)
+    GIT_PROBE_TIMEOUT = 2
+    # Seconds a passed user.name/user.email check is trusted for a project
+    GIT_CONFIG_TTL = 3600
+    GIT_DIFF_TIMEOUT = 10
+    # Seconds a found .git entry is trusted (the folder can be deleted or re-cloned)
+    REPO_HIT_TTL = 60
+    # Seconds a failed .git probe is reused (covers multi-press bursts)
+    REPO_MISS_TTL = 0.5
+    # The same notification repeated within this many seconds is dropped
+    NOTIFY_DEDUP_SECONDS = 0.2
+    # All dialog work runs on one reused pool thread (no thread per press)
+    _dialog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git-dlg")
+    # Held from the moment a dialog is queued until it closes
+    _dialog_lock = threading.Lock()
+    
+    def __init__(self, config_manager, command_executor):
+        super().__init__(config_manager, command_executor)
+        # Folder -> monotonic time a .git entry was last found there
+        self._verified_repos: dict[str, float] = {}
+        # Folder -> monotonic time a .git probe last failed there
+        self._missing_repos: dict[str, float] = {}
+        # Saved subfolder -> enclosing repo root found by git
+        self._toplevels: dict[str, str] = {}
+        # Project path -> monotonic time its git identity check passed
+        self._git_config_ok: dict[str, float] = {}
+        # (config revision, active project, saved projects)
+        self._snapshot: tuple[int, Optional[dict], list[dict]] | None = None
+        # (title, message, monotonic time) of the last notification shown
+        self._last_notif: tuple[str, str, float] = ("", "", 0.0)
+        self._notif_lock = threading.Lock()
+        # action name -> handler
+        self._actions = {
+            "commit": self._commit_workflow,
+            "select": self._show_project_selector_async,
+            "manage": self._show_project_selector_async,
+            "menu": self._show_git_menu_async,
+        }
     
     def execute(self, event: InputEvent, action: str) -> FeatureResult:
         """Execute the git commit action"""
         
         # Prevent multiple dialogs
-        if self._is_dialog_open:
+        if self._dialog_lock.locked():
             logger.warning("Dialog already open, ignoring request")
             return FeatureResult(
                 status=FeatureStatus.CANCELLED,
                 message="Dialog already open"
             )
         
-        if action == "commit":
-            return self._commit_workflow()
-        elif action == "select":
-            return self._show_project_selector_async()
-        elif action == "manage":
-            return self._show_project_selector_async()
-        elif action == "menu":
-            return self._show_git_menu_async()
-        else:
-            return FeatureResult(
-                status=FeatureStatus.ERROR,
-                message=f"Unknown action: {action}"
-            )
+        handler = self._actions.get(action)
+        if handler:
+            return handler()
+        return FeatureResult(
+            status=FeatureStatus.ERROR,
+            message=f"Unknown action: {action}"
+        )
     
     def _normalize_path(self, path_str: str) -> Path:
         """Normalize path string to proper Path object - handles all formats"""
         if not path_str:
             return None
         
-        # Convert to Path object and resolve to absolute path
+        # Not resolved: checking and running don't need the canonical form
+        # (resolve() opens the file on Windows); callers still check exists()
         try:
-            import os
-            expanded = os.path.expandvars(path_str)
-            # Replace forward slashes with backslashes for Windows consistency
-            normalized = expanded.replace('/', '\\')
-            path = Path(normalized)
-            
-            # Resolve to get absolute path with consistent format
-            if path.exists():
-                return path.resolve()
-            return path
+            return _normalize_project_path(path_str)
         except Exception as e:
             logger.error(f"Path normalization failed for '{path_str}': {e}")
             return None
 
+    def _config_snapshot(self) -> tuple[Optional[dict], list[dict]]:
+        """(active project, saved projects), re-read only when the config changes"""
+        revision = self.config_manager.revision
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] != revision:
+            snapshot = (
+                revision,
+                self.config_manager.get_active_project(self.CONFIG_KEY),
+                self.config_manager.get_projects(self.CONFIG_KEY)
+            )
+            self._snapshot = snapshot
+        return snapshot[1], snapshot[2]
+
+    def _is_git_repo(self, path) -> bool:
+        """Check for a .git entry (folder, or file for worktrees/submodules)"""
+        path_str = str(path)
+        now = time.monotonic()
+        found_at = self._verified_repos.get(path_str)
+        if found_at is not None and now - found_at < self.REPO_HIT_TTL:
+            return True
+        # A miss is trusted briefly, so a burst of presses stats once
+        missed_at = self._missing_repos.get(path_str)
+        if missed_at is not None and now - missed_at < self.REPO_MISS_TTL:
+            return False
+        if os.path.exists(os.path.join(path_str, ".git")):
+            self._missing_repos.pop(path_str, None)
+            self._verified_repos[path_str] = now
+            return True
+        self._verified_repos.pop(path_str, None)
+        self._missing_repos[path_str] = now
+        return False
+
+    def _find_toplevel(self, project_path: Path) -> Optional[str]:
+        """Root of the repo containing project_path (one git call, then cached)"""
+        path_str = os.fspath(project_path)
+        toplevel = self._toplevels.get(path_str)
+        if toplevel:
+            return toplevel
+        try:
+            result = subprocess.run(
+                ["git", "-C", path_str, "rev-parse", "--show-toplevel"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8', errors='replace',
+                timeout=self.GIT_PROBE_TIMEOUT,
+                creationflags=_NO_WINDOW
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"git rev-parse failed in {path_str}: {e}")
+            return None
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        # git prints forward slashes, even on Windows
+        toplevel = os.path.normpath(result.stdout.strip())
+        self._toplevels[path_str] = toplevel
+        return toplevel
+
     def _commit_workflow(self) -> FeatureResult:
         """Run the full commit workflow with active project"""
         
-        from core.commands.command_executor import find_git_path
-        
-        # Check if Git is installed first
-        if not find_git_path():
+        # Check if Git is installed first (cached after the first lookup)
+        if not lookup_git_path():
             self._show_notification_async(
                 "❌ Git ไม่พบในเครื่อง",
                 "กรุณาติดตั้ง Git ก่อนใช้งาน"
@@ -96,7 +227,7 @@ class GitCommitFeature(BaseFeature):
             )
         
         # Get active project
-        active = self.config_manager.get_active_project(self.CONFIG_KEY)
+        active, projects = self._config_snapshot()
         logger.info(f"Active project from config: {active}")
         
         if active:
@@ -104,29 +235,22 @@ class GitCommitFeature(BaseFeature):
             project_path = self._normalize_path(active.get("path", ""))
             logger.info(f"Normalized project path: {project_path}")
             
-            if project_path and project_path.exists():
-                logger.info(f"Project path exists: {project_path}")
-                
-                # Check for .git folder (try multiple ways)
-                git_folder = project_path / ".git"
-                git_exists = git_folder.exists() or git_folder.is_dir()
-                logger.info(f"Git folder check: {git_folder} -> exists={git_exists}")
-                
-                if git_exists:
-                    logger.info(f"Using active git project: {active.get('name', project_path.name)}")
-                    return self._run_commit_async(project_path)
-                else:
-                    logger.warning(f".git folder not found at {git_folder}")
-                    # Try to find .git in parent directories (in case user selected subfolder)
-                    for parent in project_path.parents:
-                        if (parent / ".git").exists():
-                            logger.info(f"Found .git in parent: {parent}")
-                            return self._run_commit_async(parent)
+            # A .git entry proves the folder exists too, so the common case is
+            # one stat; the folder itself is only checked when that fails
+            if project_path and self._is_git_repo(project_path):
+                logger.info(f"Using active git project: {active.get('name') or project_path.name}")
+                return self._run_commit_async(project_path)
+            elif project_path and os.path.isdir(project_path):
+                logger.warning(f".git folder not found at {project_path}")
+                # Ask git for the enclosing repo (in case user selected subfolder)
+                toplevel = self._find_toplevel(project_path)
+                if toplevel:
+                    logger.info(f"Found .git in parent: {toplevel}")
+                    return self._run_commit_async(Path(toplevel))
             else:
                 logger.warning(f"Active project path does not exist: {project_path}")
         
-        # Get all projects
-        projects = self.config_manager.get_projects(self.CONFIG_KEY)
+        # All projects (from the same snapshot)
         logger.info(f"All projects: {len(projects) if projects else 0}")
         
         if not projects:
@@ -137,73 +261,56 @@ class GitCommitFeature(BaseFeature):
         # If only one project, use it directly
         if len(projects) == 1:
             project_path = self._normalize_path(projects[0].get("path", ""))
-            if project_path and project_path.exists():
-                git_folder = project_path / ".git"
-                if git_folder.exists():
-                    self.config_manager.set_active_project(self.CONFIG_KEY, str(project_path))
-                    return self._run_commit_async(project_path)
-        
-        # Multiple projects - show selector
-        return self._show_project_selector_async()
-    
-    def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import subprocess
-        import sys
-        import json
-        from pathlib import Path
-        
-        # Point to ui/dialogs.py relative to this file
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
+            if project_path and self._is_git_repo(project_path):
+                # Canonical form only for what gets saved
+                self.config_manager.set_active_project(self.CONFIG_KEY, str(project_path.resolve()))
+                return self._run_commit_async(project_path)
         
-        try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                 cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                 cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
-
-            # Run without window creation flag on Windows if possible, but keep simple for now
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8',
-                errors='replace'
-            )
+        # Multiple projects - show selector (with the list already loaded)
+        return self._show_project_selector_async(projects)
+    
+    def _submit(self, target, *args) -> bool:
+        """
+        Run a dialog task on the pool. Returns False if a dialog is already open or queued.
+        
+        The dialog lock is taken here rather than when the task starts, so two
+        quick presses can't both get a dialog queued; the task releases it.
+        """
+        if not self._dialog_lock.acquire(blocking=False):
+            return False
             
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
-
-    def _show_project_selector_async(self) -> FeatureResult:
-        """Show project selection dialog in a separate thread"""
         def run_dialog():
-            self._is_dialog_open = True
             try:
-                self._show_project_selector()
+                target(*args)
+            except Exception as e:
+                # The future is never read, so log here or the error is lost
+                logger.error(f"Git dialog task failed: {e}")
             finally:
-                self._is_dialog_open = False
-        
-        threading.Thread(target=run_dialog, daemon=True).start()
-        return FeatureResult(status=FeatureStatus.SUCCESS, message="Opening project selector...")
+                self._dialog_lock.release()
+        self._dialog_executor.submit(run_dialog)
+        return True
+
+    def _run_in_dialog(self, target, opening_msg: str, *args) -> FeatureResult:
+        """Submit a dialog task and report it as the action's result"""
+        if not self._submit(target, *args):
+            return FeatureResult(
+                status=FeatureStatus.CANCELLED,
+                message="Dialog already open"
+            )
+        return FeatureResult(status=FeatureStatus.SUCCESS, message=opening_msg)
+
+    def _run_dialog_subprocess(self, command, data):
+        """Helper to run a dialog through the shared dialog process"""
+        return DialogClient.get().call(command, data)
+
+    def _show_project_selector_async(self, projects: Optional[list[dict]] = None) -> FeatureResult:
+        """Show project selection dialog on the dialog worker"""
+        return self._run_in_dialog(self._show_project_selector, "Opening project selector...", projects)
     
-    def _show_project_selector(self) -> bool:
+    def _show_project_selector(self, projects: Optional[list[dict]] = None) -> bool:
         """Show project selection dialog (runs in thread). Returns True if project was selected/added."""
-        projects = self.config_manager.get_projects(self.CONFIG_KEY)
+        if projects is None:
+            _, projects = self._config_snapshot()
         
         result_data = self._run_dialog_subprocess("ask_project_selection", {
             "projects": projects,
@@ -225,12 +332,12 @@ class GitCommitFeature(BaseFeature):
             project = result["project"]
             project_path = Path(project["path"])
             
-            if not project_path.exists():
-                self._show_notification_async("❌ Error", f"Path not found: {project_path}")
-                return
-            
-            if not (project_path / ".git").exists():
-                self._show_notification_async("❌ Error", "Not a git repository")
+            # One (cached) .git probe; only stat the folder itself to explain a failure
+            if not self._is_git_repo(project_path):
+                if not os.path.isdir(project_path):
+                    self._show_notification_async("❌ Error", f"Path not found: {project_path}")
+                else:
+                    self._show_notification_async("❌ Error", "Not a git repository")
                 return
             
             # Set as active (don't auto-run commit, return True to re-open menu)
@@ -241,12 +348,12 @@ class GitCommitFeature(BaseFeature):
         elif action == "add":
             path = result["path"]
             # Verify it's a git repo
-            if not (Path(path) / ".git").exists():
+            if not self._is_git_repo(path):
                 self._show_notification_async("❌ Not a Git Repository", "Please select a folder with .git")
                 return
             
             self.config_manager.add_project(self.CONFIG_KEY, path)
-            self._show_notification_async("✅ Git Project Added", f"Added: {Path(path).name}")
+            self._show_notification_async("✅ Git Project Added", f"Added: {os.path.basename(path)}")
             
             # Set as active (don't auto-run commit, return True to re-open menu)
             self.config_manager.set_active_project(self.CONFIG_KEY, path)
@@ -254,26 +361,21 @@ class GitCommitFeature(BaseFeature):
         
         elif action == "remove":
             project = result["project"]
-            self.config_manager.remove_project(self.CONFIG_KEY, project["path"])
+            if self.config_manager.remove_project(self.CONFIG_KEY, project["path"]):
+                # Drop it from the list we already have instead of reloading
+                remaining = [p for p in projects if p["path"] != project["path"]]
+            else:
+                _, remaining = self._config_snapshot()
             self._show_notification_async("🗑️ Project Removed", f"Removed: {project['name']}")
             
             # Show selector again if there are more projects
-            remaining = self.config_manager.get_projects(self.CONFIG_KEY)
             if remaining:
-                self._show_project_selector()
+                self._show_project_selector(remaining)
             return False  # Don't re-open menu after remove
     
     def _add_new_project_async(self) -> FeatureResult:
-        """Add a new project (runs in thread)"""
-        def run_dialog():
-            self._is_dialog_open = True
-            try:
-                self._add_new_project()
-            finally:
-                self._is_dialog_open = False
-        
-        threading.Thread(target=run_dialog, daemon=True).start()
-        return FeatureResult(status=FeatureStatus.SUCCESS, message="Opening folder selector...")
+        """Add a new project (runs on the dialog worker)"""
+        return self._run_in_dialog(self._add_new_project, "Opening folder selector...")
     
     def _add_new_project(self):
         """Add a new git project (runs in thread)"""
@@ -289,7 +391,7 @@ class GitCommitFeature(BaseFeature):
         path = Path(project_path)
         
         # Verify it's a git repo
-        if not (path / ".git").exists():
+        if not self._is_git_repo(path):
             self._show_notification_async("❌ Not a Git Repository", "Please select a folder with .git")
             return
         
@@ -302,38 +404,59 @@ class GitCommitFeature(BaseFeature):
     
     def _run_commit_async(self, project_path: Path) -> FeatureResult:
         """Run commit workflow asynchronously"""
-        def run():
-            self._is_dialog_open = True
-            try:
-                self._run_commit(project_path)
-            finally:
-                self._is_dialog_open = False
-        
-        threading.Thread(target=run, daemon=True).start()
-        return FeatureResult(status=FeatureStatus.SUCCESS, message=f"Opening commit dialog for {project_path.name}...")
+        return self._run_in_dialog(self._run_commit, f"Opening commit dialog for {project_path.name}...", project_path)
     
-    def _check_git_config(self, project_path: Path) -> bool:
-        """Check if user.name and user.email are configured"""
-        import subprocess
+    def _start_index_refresh(self, project_path: Path) -> Optional[subprocess.Popen]:
+        """Start 'git update-index --refresh' in the background (None if git can't start)"""
         try:
-            name = subprocess.check_output(
-                ["git", "config", "user.name"],
+            return subprocess.Popen(
+                ["git", "update-index", "-q", "--refresh"],
                 cwd=project_path,
-                text=True,
-                encoding='utf-8', errors='replace'
-            ).strip()
-            email = subprocess.check_output(
-                ["git", "config", "user.email"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=_NO_WINDOW
+            )
+        except OSError as e:
+            logger.warning(f"Index refresh failed to start: {e}")
+            return None
+
+    def _check_git_config(self, project_path: Path) -> bool:
+        """Check if user.name and user.email are configured (a pass is cached for GIT_CONFIG_TTL)"""
+        path_str = os.fspath(project_path)
+        checked_at = self._git_config_ok.get(path_str)
+        if checked_at is not None and time.monotonic() - checked_at < self.GIT_CONFIG_TTL:
+            return True
+        
+        # One git process lists every key; -z gives "key\nvalue\0" entries
+        try:
+            result = subprocess.run(
+                ["git", "config", "--list", "-z"],
                 cwd=project_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                encoding='utf-8', errors='replace'
-            ).strip()
-            return bool(name and email)
-        except subprocess.CalledProcessError:
+                encoding='utf-8', errors='replace',
+                timeout=self.GIT_PROBE_TIMEOUT,
+                creationflags=_NO_WINDOW
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"git config timed out in {project_path}")
             return False
+        values = {}
+        for entry in result.stdout.split("\0"):
+            key, _, value = entry.partition("\n")
+            if key in ("user.name", "user.email"):
+                # Later entries (repo config) override earlier ones (global)
+                values[key] = value.strip()
+        if values.get("user.name") and values.get("user.email"):
+            self._git_config_ok[path_str] = time.monotonic()
+            return True
+        return False
             
     def _run_commit(self, project_path: Path):
         """Run the actual commit workflow (runs in thread)"""
+        path_str = os.fspath(project_path)
+        project_name = os.path.basename(path_str)
         logger.info(f"Checking git config for: {project_path}")
         if not self._check_git_config(project_path):
             logger.warning("Git config check failed")
@@ -341,18 +464,32 @@ class GitCommitFeature(BaseFeature):
             return
         logger.info("Git config check passed")
 
-        # Ask for commit message
-        result = self._run_dialog_subprocess("ask_commit_message", {
-            "title": f"Commit to {project_path.name}",
-            "initial_value": ""
-        })
+        # Scan the working tree while the user types, so 'git add .' only has
+        # to hash what really changed (doesn't stage anything by itself)
+        refresh = self._start_index_refresh(project_path)
+
+        try:
+            # Ask for commit message
+            result = self._run_dialog_subprocess("ask_commit_message", {
+                "title": f"Commit to {project_name}",
+                "initial_value": ""
+            })
+        finally:
+            # The refresh holds index.lock while it writes; let it finish
+            # (cancelled or not) so it doesn't block the next git command
+            if refresh:
+                try:
+                    refresh.wait(timeout=self.GIT_DIFF_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    refresh.kill()
+                    refresh.wait()
         
         if not result or not result.get("message"):
             logger.info("User cancelled commit")
             return
             
         commit_message = result.get("message")
-        logger.info(f"Committing to {project_path} with message: {commit_message}")
+        logger.info(f"Committing to {path_str} with message: {commit_message}")
         
         # Run git add, commit, push in interactive terminal
         commands = [
@@ -364,29 +501,18 @@ class GitCommitFeature(BaseFeature):
         success = self.command_executor.execute_interactive(
             commands=commands,
             cwd=project_path,
-            title=f"Git Commit: {project_path.name}"
+            title=self.TERMINAL_TITLE_PREFIX + project_name
         )
         
         if success:
-            self._show_notification_async("✅ Git Commit", f"Committed: {commit_message[:50]}...")
+            self._show_notification_async("✅ Git Commit", self.COMMITTED_PREFIX + commit_message[:50] + "...")
     
     def _show_git_menu_async(self) -> FeatureResult:
-        """Show git menu in thread"""
-        def run_menu():
-            self._is_dialog_open = True
-            try:
-                self._show_git_menu()
-            except Exception as e:
-                logger.error(f"Git menu error: {e}")
-            finally:
-                self._is_dialog_open = False
-                logger.info("Git menu closed, dialog flag reset")
-                
-        threading.Thread(target=run_menu, daemon=True).start()
-        return FeatureResult(status=FeatureStatus.SUCCESS, message="Opening Git Menu...")
+        """Show git menu on the dialog worker"""
+        return self._run_in_dialog(self._show_git_menu, "Opening Git Menu...")
 
     def _show_git_menu(self):
-        active = self.config_manager.get_active_project(self.CONFIG_KEY)
+        active, _ = self._config_snapshot()
         
         # Friendly project display
         if active:
@@ -432,7 +558,7 @@ class GitCommitFeature(BaseFeature):
         # Ensure active project for remaining actions
         if not active:
              if self._show_project_selector(): 
-                 active = self.config_manager.get_active_project(self.CONFIG_KEY)
+                 active, _ = self._config_snapshot()
              
         if not active:
             return
@@ -474,8 +600,6 @@ class GitCommitFeature(BaseFeature):
     
     def _run_clone_project(self):
         """Clone a git repository"""
-        import os
-        
         # Reload config to get latest settings
         self.config_manager.load()
         
@@ -517,36 +641,91 @@ class GitCommitFeature(BaseFeature):
             f"Cloning to:\n{full_path}\n\nProject added to list!"
         )
 
+    def _start_git(self, args: list[str], project_path: Path):
+        """Start a git command with stdout piped back (no console window)"""
+        return subprocess.Popen(
+            ["git", *args],
+            cwd=project_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=_NO_WINDOW
+        )
+
+    def _read_diff(self, proc) -> tuple[str, list[str]]:
+        """
+        Stream a git diff, keeping only its head (enough for the AI prompt)
+        and the path of every changed file, so huge diffs aren't held in memory.
+        """
+        head = bytearray()
+        files = []
+        with proc.stdout:
+            for line in proc.stdout:
+                if len(head) < self.DIFF_HEAD_BYTES:
+                    head += line
+                if line.startswith(b"diff --git a/"):
+                    files.append(line[len(b"diff --git a/"):].split(b" ", 1)[0].decode("utf-8", "replace"))
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        return head[:self.DIFF_HEAD_BYTES].decode("utf-8", "replace"), files
+
+    def _read_changes(self, project_path: Path) -> tuple[str, list[str]]:
+        """
+        Get the changes to describe: staged diff, else working tree diff,
+        else `git status --short` (e.g. only untracked files).
+        
+        All three git processes start together so the fallbacks don't each
+        pay process startup; once one has output the rest are killed.
+        """
+        procs = [
+            self._start_git(["diff", "--cached"], project_path),
+            self._start_git(["diff"], project_path),
+            self._start_git(["status", "--short"], project_path),
+        ]
+        timed_out = threading.Event()
+        
+        def kill_all():
+            timed_out.set()
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+        # Killing closes the pipes, which ends any read in progress
+        timer = threading.Timer(self.GIT_DIFF_TIMEOUT, kill_all)
+        timer.daemon = True
+        timer.start()
+        try:
+            for proc in procs[:2]:
+                diff_output, files = self._read_diff(proc)
+                if diff_output.strip():
+                    return diff_output, files
+            
+            status_output, _ = self._read_diff(procs[2])
+            files = [line[3:].split(" -> ")[-1].strip('"').rstrip("/")
+                     for line in status_output.splitlines() if len(line) > 3]
+            return status_output, files
+        except subprocess.CalledProcessError as e:
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(e.cmd, self.GIT_DIFF_TIMEOUT) from None
+            raise
+        finally:
+            timer.cancel()
+            # Reap every process, including ones that already exited (their
+            # pipe may still be open if nothing read it to EOF)
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stdout.close()
+                proc.wait()
+
     def _run_ai_commit(self, project_path: Path):
         """AI-assisted commit message with preview dialog"""
-        import subprocess
-        import pyperclip
-        import webbrowser
-        
         try:
-            # Get git diff
-            staged_diff = subprocess.check_output(
-                ["git", "diff", "--cached"], 
-                cwd=project_path, text=True,
-                encoding='utf-8', errors='replace'
-            )
-            
-            diff_output = staged_diff
-            if not staged_diff.strip():
-                diff_output = subprocess.check_output(
-                    ["git", "diff"],
-                    cwd=project_path, text=True,
-                    encoding='utf-8', errors='replace'
-                )
+            # Get changes (staged first, else working tree, else status)
+            diff_output, files_changed = self._read_changes(project_path)
                 
             if not diff_output.strip():
                 self._show_notification_async("⚠️ ไม่มีการเปลี่ยนแปลง", "ไม่พบไฟล์ที่มีการแก้ไข")
                 return
             
-            # Count changed files
-            lines = diff_output.split('\n')
-            files_changed = [l.replace('diff --git a/', '').split(' ')[0] for l in lines if l.startswith('diff --git')]
-            
             # Get basenames only
             basenames = [f.split('/')[-1] for f in files_changed]
             
@@ -573,28 +752,8 @@ class GitCommitFeature(BaseFeature):
             is_thai = (lang == "th")
             
             # Prepare prompt based on language
-            if is_thai:
-                prompt = f"""เขียน git commit message สำหรับการเปลี่ยนแปลงนี้
-รูปแบบ: <type>: <ข้อความภาษาไทย>
-Types: feat, fix, docs, refactor, test, chore
-ความยาวไม่เกิน 50 ตัวอักษร
-
-```
-{diff_output[:2500]}
-```
-
-ตอบแค่ commit message เท่านั้น"""
-            else:
-                prompt = f"""Write a git commit message for these changes.
-Format: <type>: <subject>
-Types: feat, fix, docs, refactor, test, chore
-Keep under 50 chars.
-
-```
-{diff_output[:2500]}
-```
-
-Reply with ONLY the commit message."""
+            template = AI_PROMPT_TH if is_thai else AI_PROMPT_EN
+            prompt = template.format(diff=diff_output[:AI_PROMPT_DIFF_CHARS])
             
             # Copy to clipboard
             pyperclip.copy(prompt)
@@ -616,9 +775,11 @@ Reply with ONLY the commit message."""
             self._show_notification_async("❌ เกิดข้อผิดพลาด", f"ไม่สำเร็จ: {str(e)}")
             
     def _show_notification_async(self, title: str, message: str):
-        """Show notification in a separate thread"""
-        self._run_dialog_subprocess("show_notification", {
-            "title": title,
-            "message": message,
-            "duration": 3000
-        })
+        """Show notification (fire and forget); drops an identical one sent just before"""
+        now = time.monotonic()
+        with self._notif_lock:
+            last_title, last_message, last_time = self._last_notif
+            if (title, message) == (last_title, last_message) and now - last_time < self.NOTIFY_DEDUP_SECONDS:
+                return
+            self._last_notif = (title, message, now)
+        show_notification(title, message, duration=3000)
@@ -5,13 +5,25 @@ Actions:
 - status: Show git status for a project folder
 """
 
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from core.commands.command_executor import lookup_git_path
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
+from utils.dialog_client import DialogClient, send_dialog_payload, show_notification, start_dialog
 from utils.logger import get_logger
+from utils.project_detector import get_active_project_path
 
 logger = get_logger(__name__)
 
+# Keep the rev-parse probe from flashing a console window (decided once at import)
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
 
 class GitStatusFeature(BaseFeature):
     """
@@ -26,88 +38,121 @@ class GitStatusFeature(BaseFeature):
     
     # Remember last used path
     _last_path = None
+    # Git bin folder once found (it doesn't move during a session)
+    _git_path = None
+    # Folder -> (is a git work tree, monotonic time checked)
+    _repo_cache: dict[str, tuple[bool, float]] = {}
+    REPO_CACHE_TTL = 60
+    # Seconds to wait for the rev-parse fallback
+    GIT_PROBE_TIMEOUT = 2
+    # Status checks run off the hotkey thread, one at a time
+    _status_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git-status")
+    # Held from the moment a check is queued until it finishes
+    _status_lock = threading.Lock()
     
     def execute(self, event: InputEvent, action: str) -> FeatureResult:
         """Execute the git status action"""
         
         if action == "status":
-            return self._show_status()
+            if not self._status_lock.acquire(blocking=False):
+                logger.warning("Git status already running, ignoring request")
+                return FeatureResult(
+                    status=FeatureStatus.CANCELLED,
+                    message="Git status already running"
+                )
+            self._status_executor.submit(self._run_status)
+            return FeatureResult(
+                status=FeatureStatus.SUCCESS,
+                message="Checking git status..."
+            )
         else:
             return FeatureResult(
                 status=FeatureStatus.ERROR,
                 message=f"Unknown action: {action}"
             )
             
-    def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import subprocess
-        import sys
-        import json
-        from pathlib import Path
-        
-        # Point to ui/dialogs.py relative to this file
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        
+    def _run_status(self):
+        """Worker side of execute: report what the router would have, then release the lock"""
         try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                 cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                 cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
-            
-            # Run without window creation flag on Windows if possible, but keep simple for now
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
+            result = self._show_status()
+            # Skip errors _show_status already put on screen (toast or error viewer)
+            if result.status == FeatureStatus.ERROR and not (result.data or {}).get("notified"):
+                self._show_notification_async(f"❌ {self.name} Error", result.message or "Unknown error")
         except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
+            # The future is never read, so log here or the error is lost
+            logger.error(f"Git status failed: {e}")
+        finally:
+            self._status_lock.release()
+
+    def _run_dialog_subprocess(self, command, data):
+        """Helper to run a dialog through the shared dialog process"""
+        return DialogClient.get().call(command, data)
     
     def _show_notification_async(self, title: str, message: str, duration: int = 5000):
-        """Show notification via subprocess"""
-        self._run_dialog_subprocess("show_notification", {
-            "title": title,
-            "message": message,
-            "duration": duration
-        })
+        """Show notification (fire and forget, doesn't hold the dialog process)"""
+        show_notification(title, message, duration)
 
-    def _show_status(self) -> FeatureResult:
-        """Show git status for selected project"""
+    @classmethod
+    def _is_git_repo(cls, project_path: Path) -> bool:
+        """
+        True if project_path is in a git work tree (cached for REPO_CACHE_TTL).
         
-        from utils.project_detector import get_active_project_path
-        from core.commands.command_executor import find_git_path
+        A .git folder or file (worktrees, submodules) answers it without git;
+        otherwise one 'git rev-parse' settles it (e.g. a subfolder of a repo).
+        """
+        path_str = os.fspath(project_path)
+        now = time.monotonic()
+        cached = cls._repo_cache.get(path_str)
+        if cached and now - cached[1] < cls.REPO_CACHE_TTL:
+            return cached[0]
         
-        # Check if Git is installed first
-        if not find_git_path():
-            self._show_notification_async(
-                "❌ Git ไม่พบในเครื่อง",
-                "กรุณาติดตั้ง Git ก่อนใช้งาน\ngit-scm.com/download/win"
-            )
-            return FeatureResult(
-                status=FeatureStatus.ERROR,
-                message="Git not found"
-            )
+        is_repo = os.path.exists(os.path.join(path_str, ".git"))
+        if not is_repo:
+            try:
+                result = subprocess.run(
+                    ["git", "-C", path_str, "rev-parse", "--is-inside-work-tree"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    timeout=cls.GIT_PROBE_TIMEOUT,
+                    creationflags=_NO_WINDOW
+                )
+                # Prints "false" inside a bare repo, where git status can't run
+                is_repo = result.returncode == 0 and result.stdout.strip() == b"true"
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"git rev-parse failed in {path_str}: {e}")
+                # Not cached, so the next press tries again
+                return False
         
-        # Try to auto-detect from active window (VS Code)
-        project_path = get_active_project_path()
+        cls._repo_cache[path_str] = (is_repo, now)
+        return is_repo
+
+    def _show_status(self) -> FeatureResult:
+        """Show git status for selected project"""
+        
+        if self._git_path:
+            # Try to auto-detect from active window (VS Code)
+            project_path = get_active_project_path(hint=self._last_path)
+        else:
+            # Until git has been found, look for it (PATH walk, install dirs,
+            # registry) while the active window is inspected; a miss is only
+            # searched again once a minute
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                git_future = pool.submit(lookup_git_path)
+                project_path = get_active_project_path(hint=self._last_path)
+                git_path = git_future.result()
+            
+            # Check if Git is installed first
+            if not git_path:
+                self._show_notification_async(
+                    "❌ Git ไม่พบในเครื่อง",
+                    "กรุณาติดตั้ง Git ก่อนใช้งาน\ngit-scm.com/download/win"
+                )
+                return FeatureResult(
+                    status=FeatureStatus.ERROR,
+                    message="Git not found",
+                    data={"notified": True}
+                )
+            type(self)._git_path = git_path
         
         # Fall back to saved path
         if not project_path:
@@ -127,7 +172,7 @@ class GitStatusFeature(BaseFeature):
             project_path = Path(result.get("path"))
         
         # Verify it's a git repository
-        if not (project_path / ".git").exists():
+        if not self._is_git_repo(project_path):
             return FeatureResult(
                 status=FeatureStatus.ERROR,
                 message=f"Not a git repository: {project_path}"
@@ -138,28 +183,43 @@ class GitStatusFeature(BaseFeature):
         
         logger.info(f"Running git status in {project_path}")
         
+        # Start the viewer's process while git status runs, so its interpreter
+        # and Tk load in the meantime; it waits on stdin for the output
+        viewer = start_dialog("show_git_output")
+        
         # Run git status using command executor (this is fine as it's just getting output, not UI)
         result = self.command_executor.execute(
             command=["git", "status"],
             cwd=project_path
         )
         
-        # Display output via subprocess dialog
+        # Display output in its own process, without waiting for it: the viewer
+        # stays open while the user reads it, so it must not hold the shared
+        # dialog process or this feature's lock
+        payload = None
         if result.stdout:
-            self._run_dialog_subprocess("show_git_output", {
+            payload = {
                 "title": f"📊 Git Status: {project_path.name}",
                 "output": result.stdout,
                 "is_error": False
-            })
+            }
         elif result.stderr:
-             self._run_dialog_subprocess("show_git_output", {
+            payload = {
                 "title": f"❌ Git Error: {project_path.name}",
                 "output": result.stderr,
                 "is_error": True
-            })
+            }
+        
+        if viewer:
+            if payload:
+                send_dialog_payload(viewer, payload)
+            else:
+                # Nothing to show
+                viewer.kill()
+                viewer.wait()
         
         return FeatureResult(
             status=FeatureStatus.SUCCESS if result.return_code == 0 else FeatureStatus.ERROR,
             message=f"Git status for {project_path.name}",
-            data={"path": str(project_path)}
+            data={"path": str(project_path), "notified": bool(viewer and payload)}
         )
@@ -9,6 +9,7 @@ Actions:
 
 from core.features.base_feature import BaseFeature, FeatureResult, FeatureStatus
 from core.events.input_event import InputEvent, PressType
+from utils.dialog_client import DialogClient
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -43,47 +44,8 @@ class ModeSwitcherFeature(BaseFeature):
             return self._next_mode()
     
     def _run_dialog_subprocess(self, command, data):
-        """Helper to run dialog subprocess"""
-        import subprocess
-        import sys
-        import json
-        from pathlib import Path
-        
-        # Point to ui/dialogs.py relative to this file
-        dialog_script = Path(__file__).parent.parent / "ui" / "dialogs.py"
-        
-        try:
-            is_frozen = getattr(sys, 'frozen', False)
-            if is_frozen:
-                 cmd = [sys.executable, "dialog", command, json.dumps(data)]
-            else:
-                 cmd = [sys.executable, str(dialog_script), command, json.dumps(data)]
-            
-            # Run without window creation flag on Windows if possible, but keep simple for now
-            creation_flags = 0
-            if sys.platform == "win32":
-                creation_flags = subprocess.CREATE_NO_WINDOW
-                
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                creationflags=creation_flags,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode != 0:
-                logger.error(f"Dialog error ({command}): {result.stderr}")
-                return None
-                
-            if not result.stdout.strip():
-                return None
-                
-            return json.loads(result.stdout)
-        except Exception as e:
-            logger.error(f"Subprocess failed: {e}")
-            return None
+        """Helper to run a dialog through the shared dialog process"""
+        return DialogClient.get().call(command, data)
 
     def _get_mode_manager(self):
         """Get mode manager from feature registry"""
@@ -13,6 +13,35 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Press pattern -> label shown in the guide
+PATTERN_DISPLAY = {
+    "short": "กดสั้น", 
+    "long": "กดค้าง", 
+    "double": "กด 2 ครั้ง",
+    "multi_3": "กด 3 ครั้ง"
+}
+
+# Map technical action names to user-friendly names
+ACTION_DISPLAY = {
+    "execute": "Execute Tool",
+    "menu": "Action Menu",
+    "clone": "Clone Project",
+    "update": "Update Project",
+    "run_dev": "Run Dev Server",
+    "select": "Select Project",
+    "reset_path": "Reset Path",
+    "next_mode": "Switch Mode",
+    "show": "Show Guide",
+    "status": "Check Status",
+    "commit": "Commit & Push",
+    "prompt": "Smart Prompt",
+    "review_secure": "Code Review",
+    "explain_code": "Explain Code",
+    "bug_fix": "Fix Bugs",
+    "launch_snippets": "Snippet Tool",
+    "launch_smart_terminal": "Smart Terminal"
+}
+
 
 class ShortcutGuideFeature(BaseFeature):
     """
@@ -28,6 +57,8 @@ class ShortcutGuideFeature(BaseFeature):
     # Track active window for singleton behavior
     _active_root = None
     _active_popup = None
+    # mode -> (config revision, guide lines); shared list, don't mutate
+    _guide_cache: dict[str, tuple[int, list[dict]]] = {}
     
     def execute(self, event: InputEvent, action: str) -> FeatureResult:
         """Execute the shortcut guide display"""
@@ -43,6 +74,30 @@ class ShortcutGuideFeature(BaseFeature):
             return _engine.mode_manager
         return None
     
+    def _build_guide(self, mode: str) -> list[dict]:
+        """Guide lines for a mode's bindings, rebuilt only when the config changes"""
+        revision = self.config_manager.revision
+        cached = self._guide_cache.get(mode)
+        if cached and cached[0] == revision:
+            return cached[1]
+        
+        guide_lines = []
+        bindings = self.config_manager.get_mode_bindings(mode)
+        for key, binding in bindings.items():
+            feature_name = binding.get("feature", "?")
+            patterns = binding.get("patterns", {})
+            for pattern, action in patterns.items():
+                action_name = str(action)
+                guide_lines.append({
+                    "key": str(key).upper(),
+                    "pattern": PATTERN_DISPLAY.get(pattern, str(pattern)),
+                    "action": ACTION_DISPLAY.get(action_name, action_name.replace("_", " ").title()),
+                    "feature": str(feature_name)
+                })
+        
+        self._guide_cache[mode] = (revision, guide_lines)
+        return guide_lines
+    
     def _show_guide(self) -> FeatureResult:
         """Show the shortcut guide popup using a separate process for stability"""
         
@@ -53,51 +108,10 @@ class ShortcutGuideFeature(BaseFeature):
         
         current_mode = mode_manager.current_mode
         mode_name = mode_manager.get_mode_name()
-        bindings = self.config_manager.get_mode_bindings(current_mode)
         
         logger.info(f"ShortcutGuide: Preparing guide for {mode_name} (mode: {current_mode})")
         
-        # Build guide content
-        guide_lines = []
-        for key, binding in bindings.items():
-            feature_name = binding.get("feature", "?")
-            patterns = binding.get("patterns", {})
-            for pattern, action in patterns.items():
-                pattern_display = {
-                    "short": "กดสั้น", 
-                    "long": "กดค้าง", 
-                    "double": "กด 2 ครั้ง",
-                    "multi_3": "กด 3 ครั้ง"
-                }.get(pattern, str(pattern))
-                action_name = str(action)
-                # Map technical names to user-friendly names
-                display_map = {
-                    "execute": "Execute Tool",
-                    "menu": "Action Menu",
-                    "clone": "Clone Project",
-                    "update": "Update Project",
-                    "run_dev": "Run Dev Server",
-                    "select": "Select Project",
-                    "reset_path": "Reset Path",
-                    "next_mode": "Switch Mode",
-                    "show": "Show Guide",
-                    "status": "Check Status",
-                    "commit": "Commit & Push",
-                    "prompt": "Smart Prompt",
-                    "review_secure": "Code Review",
-                    "explain_code": "Explain Code",
-                    "bug_fix": "Fix Bugs",
-                    "launch_snippets": "Snippet Tool",
-                    "launch_smart_terminal": "Smart Terminal"
-                }
-                display_action = display_map.get(action_name, action_name.replace("_", " ").title())
-                
-                guide_lines.append({
-                    "key": str(key).upper(),
-                    "pattern": pattern_display,
-                    "action": display_action,
-                    "feature": str(feature_name)
-                })
+        guide_lines = self._build_guide(current_mode)
         
         # Launch popup in a separate process to avoid main process crash
         import subprocess
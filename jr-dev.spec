@@ -82,6 +82,7 @@ a = Analysis(
         'ui.system_tray',
         'ui.visual_feedback',
         'utils',
+        'utils.dialog_client',
         'utils.logger',
         'utils.statistics',
         'utils.windows_utils',
@@ -302,9 +302,11 @@ class MacroEngine:
         # Start input listener
         self.input_provider.start()
         
+        # Do the first-press work of git features now, off the main thread
+        threading.Thread(target=self._prewarm, name="prewarm", daemon=True).start()
+        
         # Start system tray in a separate thread because it blocks
         if self.system_tray:
-            import threading
             tray_thread = threading.Thread(target=self.system_tray.run, daemon=True)
             tray_thread.start()
         else:
@@ -324,6 +326,18 @@ class MacroEngine:
                 while self.running:
                     time.sleep(1)
 
+    def _prewarm(self):
+        """Look up git and load the window-inspection modules before the first hotkey"""
+        try:
+            from core.commands.command_executor import find_git_path
+            find_git_path()  # cached for the session
+            if sys.platform == "win32":
+                # Imported lazily by utils.project_detector.get_active_project_path
+                import win32gui
+                import win32process
+        except Exception as e:
+            logger.debug(f"Prewarm failed: {e}")
+
     def show_startup_notification(self):
         """Show startup notification via subprocess"""
         try:
@@ -397,10 +411,14 @@ def start():
                 sys.exit(1)
                 
         # Handle Dialogs (frozen mode)
-        elif cmd_arg == "dialog" and len(sys.argv) >= 4:
+        elif cmd_arg == "dialog" and len(sys.argv) >= 3:
             try:
-                from ui.dialogs import process_dialog_command
-                process_dialog_command(sys.argv[2], sys.argv[3])
+                from ui.dialogs import process_dialog_command, read_stdin_payload, serve_dialogs
+                if sys.argv[2] == "--serve":
+                    serve_dialogs()
+                    sys.exit(0)
+                data_str = sys.argv[3] if len(sys.argv) >= 4 else read_stdin_payload()
+                process_dialog_command(sys.argv[2], data_str)
                 sys.exit(0)
             except Exception:
                 sys.exit(1)
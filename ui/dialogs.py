@@ -1011,96 +1011,108 @@ def log_debug(msg):
     # Also print to stderr for parent capture
     # sys.stderr.write(f"DEBUG: {msg}\n")
 
+def read_stdin_payload() -> str:
+    """Read a JSON payload piped in by the parent process"""
+    # Read raw bytes: the console code page may not be UTF-8 on Windows
+    return sys.stdin.buffer.read().decode("utf-8")
+
+
+def run_dialog_command(command: str, data: dict) -> dict | None:
+    """Show the dialog for a command and return its reply payload (None for fire-and-forget commands)"""
+    log_debug(f"Payload: {data}")
+    
+    if command == "ask_choice":
+        log_debug("Calling ask_choice...")
+        result = ask_choice(
+            title=data.get("title", "Choice"),
+            message=data.get("message", "Select option:"),
+            choices=data.get("choices", [])
+        )
+        log_debug(f"ask_choice result: {result}")
+        return {"result": result}
+        
+    elif command == "ask_project_selection":
+        log_debug("Calling ask_project_selection...")
+        result = ask_project_selection(
+            projects=data.get("projects", []),
+            title=data.get("title", "Select Project"),
+            allow_add=data.get("allow_add", True),
+            allow_remove=data.get("allow_remove", True)
+        )
+        log_debug(f"ask_project_selection result: {result}")
+        return {"result": result}
+        
+    elif command == "show_notification":
+        log_debug("Calling show_notification...")
+        show_notification(
+            title=data.get("title", "Notification"),
+            message=data.get("message", ""),
+            duration=data.get("duration", 3000)
+        )
+        
+    elif command == "ask_folder_path":
+        result = ask_folder_path(
+            title=data.get("title", "Select Folder")
+        )
+        return {"path": result}
+        
+    elif command == "ask_commit_message":
+        result = ask_commit_message(
+            title=data.get("title", "Commit Message"),
+            initial_value=data.get("initial_value", "")
+        )
+        return {"message": result}
+        
+    elif command == "ask_yes_no":
+        result = ask_yes_no(
+            title=data.get("title", "Confirmation"),
+            message=data.get("message", "Are you sure?")
+        )
+        return {"result": result}
+
+    elif command == "ask_action_custom":
+        result = ask_action_custom(
+            title=data.get("title", "Action"),
+            message=data.get("message", "Choose action"),
+            buttons=data.get("buttons", ["Cancel"])
+        )
+        return {"result": result}
+        
+    elif command == "ask_ai_commit_preview":
+        result = ask_ai_commit_preview(
+            files=data.get("files", []),
+            title=data.get("title", "AI Auto-Commit"),
+            default_lang=data.get("default_lang")
+        )
+        return {"result": result}
+        
+    elif command == "show_git_output":
+        show_git_output(
+            title=data.get("title", "Git Output"),
+            output=data.get("output", ""),
+            is_error=data.get("is_error", False)
+        )
+        
+    elif command == "ask_git_clone_info":
+        result = ask_git_clone_info(
+            default_path=data.get("default_path", "C:\\Projects")
+        )
+        if result:
+            return {"git_url": result[0], "path": result[1]}
+        return {"git_url": None, "path": None}
+        
+    return None
+
+
 def process_dialog_command(command, data_str):
     import json
     log_debug(f"Processing command: {command}")
     
     try:
         data = json.loads(data_str)
-        log_debug(f"Payload: {data}")
-        
-        result = None
-        
-        if command == "ask_choice":
-            log_debug("Calling ask_choice...")
-            result = ask_choice(
-                title=data.get("title", "Choice"),
-                message=data.get("message", "Select option:"),
-                choices=data.get("choices", [])
-            )
-            log_debug(f"ask_choice result: {result}")
-            print(json.dumps({"result": result}))
-            
-        elif command == "ask_project_selection":
-            log_debug("Calling ask_project_selection...")
-            result = ask_project_selection(
-                projects=data.get("projects", []),
-                title=data.get("title", "Select Project"),
-                allow_add=data.get("allow_add", True),
-                allow_remove=data.get("allow_remove", True)
-            )
-            log_debug(f"ask_project_selection result: {result}")
-            print(json.dumps({"result": result}))
-            
-        elif command == "show_notification":
-            log_debug("Calling show_notification...")
-            show_notification(
-                title=data.get("title", "Notification"),
-                message=data.get("message", ""),
-                duration=data.get("duration", 3000)
-            )
-            
-        elif command == "ask_folder_path":
-            result = ask_folder_path(
-                title=data.get("title", "Select Folder")
-            )
-            print(json.dumps({"path": result}))
-            
-        elif command == "ask_commit_message":
-            result = ask_commit_message(
-                title=data.get("title", "Commit Message"),
-                initial_value=data.get("initial_value", "")
-            )
-            print(json.dumps({"message": result}))
-            
-        elif command == "ask_yes_no":
-            result = ask_yes_no(
-                title=data.get("title", "Confirmation"),
-                message=data.get("message", "Are you sure?")
-            )
-            print(json.dumps({"result": result}))
-
-        elif command == "ask_action_custom":
-            result = ask_action_custom(
-                title=data.get("title", "Action"),
-                message=data.get("message", "Choose action"),
-                buttons=data.get("buttons", ["Cancel"])
-            )
-            print(json.dumps({"result": result}))
-            
-        elif command == "ask_ai_commit_preview":
-            result = ask_ai_commit_preview(
-                files=data.get("files", []),
-                title=data.get("title", "AI Auto-Commit"),
-                default_lang=data.get("default_lang")
-            )
-            print(json.dumps({"result": result}))
-            
-        elif command == "show_git_output":
-            show_git_output(
-                title=data.get("title", "Git Output"),
-                output=data.get("output", ""),
-                is_error=data.get("is_error", False)
-            )
-            
-        elif command == "ask_git_clone_info":
-            result = ask_git_clone_info(
-                default_path=data.get("default_path", "C:\\Projects")
-            )
-            if result:
-                print(json.dumps({"git_url": result[0], "path": result[1]}))
-            else:
-                print(json.dumps({"git_url": None, "path": None}))
+        reply = run_dialog_command(command, data)
+        if reply is not None:
+            print(json.dumps(reply))
             
     except Exception as e:
         log_debug(f"FATAL ERROR in process_dialog_command: {e}")
@@ -1113,18 +1125,65 @@ def process_dialog_command(command, data_str):
         sys.exit(1)
 
 
+def serve_dialogs():
+    """
+    Answer dialog requests from the parent process until stdin closes.
+    
+    Used by utils.dialog_client so the interpreter and Tk are only loaded once.
+    Each message is a 4-byte big-endian length followed by a pickled dict
+    (both ends are this app; the one-shot mode keeps JSON):
+    requests are {"command": ..., "data": {...}}, replies are
+    {"ok": true, "reply": <what the one-shot mode would print, or null>}
+    or {"ok": false, "error": "..."}.
+    """
+    import pickle
+    import struct
+    
+    requests = sys.stdin.buffer
+    replies = sys.stdout.buffer
+    # Stray prints from Tk or the dialogs must not end up in the reply stream
+    sys.stdout = sys.stderr
+    log_debug("Dialog server started")
+    
+    while True:
+        header = requests.read(4)
+        if len(header) < 4:
+            break  # Parent closed the pipe
+        (length,) = struct.unpack(">I", header)
+        request = pickle.loads(requests.read(length))
+        command = request.get("command")
+        log_debug(f"Serving command: {command}")
+        
+        try:
+            message = {"ok": True, "reply": run_dialog_command(command, request.get("data") or {})}
+        except Exception as e:
+            import traceback
+            log_debug(traceback.format_exc())
+            message = {"ok": False, "error": str(e)}
+            
+        body = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        replies.write(struct.pack(">I", len(body)) + body)
+        replies.flush()
+        
+    log_debug("Dialog server stopped")
+
+
 if __name__ == "__main__":
     try:
-        if len(sys.argv) < 3:
+        if len(sys.argv) < 2:
             sys.exit(1)
             
         log_debug(f"Dialog Process Started. Args: {sys.argv}")
-        process_dialog_command(sys.argv[1], sys.argv[2])
+        if sys.argv[1] == "--serve":
+            serve_dialogs()
+            sys.exit(0)
+            
+        # Payload is passed as an argument, or on stdin when omitted
+        data_str = sys.argv[2] if len(sys.argv) >= 3 else read_stdin_payload()
+        process_dialog_command(sys.argv[1], data_str)
         log_debug("Dialog Process Finished Successfully")
     except Exception as e:
         log_debug(f"Top-level script error: {e}")
         import traceback
         log_debug(traceback.format_exc())
         sys.exit(1)
-
-
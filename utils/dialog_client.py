@@ -0,0 +1,238 @@
+"""
+Dialog Client - Run ui/dialogs.py prompts from features
+
+Dialogs run in a separate process so a Tk crash can't take the engine down.
+Starting a fresh interpreter for every prompt costs a few hundred ms, so one
+helper process is kept alive and fed requests over its stdin/stdout.
+"""
+
+import json
+import pickle
+import struct
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# orjson (optional) encodes straight to bytes and is several times faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
+DIALOG_SCRIPT = Path(__file__).parent.parent / "ui" / "dialogs.py"
+
+# Native toasts need an AppUserModelID. Unpackaged apps don't have one, so
+# borrow PowerShell's, which is registered on every Windows install.
+TOAST_APP_ID = r"{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}\WindowsPowerShell\v1.0\powershell.exe"
+TOAST_XML = (
+    "<toast><visual><binding template='ToastGeneric'>"
+    "<text>{title}</text><text>{message}</text>"
+    "</binding></visual></toast>"
+)
+
+# Keep helper processes from flashing a console window (decided once at import)
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+# None = not tried yet, False = WinRT not available
+_toast_notifier = None
+
+
+def dialog_command(*args: str) -> list[str]:
+    """Build the command line that runs ui/dialogs.py (or the frozen exe's dialog mode)"""
+    if getattr(sys, 'frozen', False):
+        return [sys.executable, "dialog", *args]
+    return [sys.executable, str(DIALOG_SCRIPT), *args]
+
+
+def run_dialog_once(command: str, data: dict) -> Optional[dict]:
+    """Run a dialog in a throwaway process (payload on stdin, reply on stdout)"""
+    try:
+        # Bytes in and out: the decoder takes the UTF-8 reply as-is, and a bad
+        # byte fails the parse instead of being silently replaced
+        result = subprocess.run(
+            dialog_command(command),
+            input=_dumps(data),
+            capture_output=True,
+            creationflags=_NO_WINDOW
+        )
+
+        if result.returncode != 0:
+            logger.error(f"Dialog error ({command}): {result.stderr.decode('utf-8', 'replace')}")
+            return None
+
+        if not result.stdout.strip():
+            return None
+
+        return _loads(result.stdout)
+    except Exception as e:
+        logger.error(f"Subprocess failed: {e}")
+        return None
+
+
+def _get_toast_notifier():
+    """Create the WinRT toast notifier once (optional 'winrt' packages)"""
+    global _toast_notifier
+    if _toast_notifier is None:
+        try:
+            from winrt.windows.ui.notifications import ToastNotificationManager
+            _toast_notifier = ToastNotificationManager.create_toast_notifier(TOAST_APP_ID)
+        except Exception as e:
+            # ImportError when winrt isn't installed, OSError on activation failure
+            logger.debug(f"Native toasts not available: {e}")
+            _toast_notifier = False
+    return _toast_notifier
+
+
+def _show_native_toast(title: str, message: str) -> bool:
+    """Show a Windows toast in-process. Returns False if it couldn't be shown."""
+    notifier = _get_toast_notifier()
+    if not notifier:
+        return False
+    try:
+        from xml.sax.saxutils import escape
+        from winrt.windows.data.xml.dom import XmlDocument
+        from winrt.windows.ui.notifications import ToastNotification
+        
+        doc = XmlDocument()
+        doc.load_xml(TOAST_XML.format(title=escape(title), message=escape(message)))
+        notifier.show(ToastNotification(doc))
+        return True
+    except Exception as e:
+        logger.debug(f"Native toast failed: {e}")
+        return False
+
+
+def start_dialog(command: str) -> Optional[subprocess.Popen]:
+    """Start a one-shot dialog process that waits for its payload on stdin (None if it can't start)"""
+    try:
+        return subprocess.Popen(
+            dialog_command(command),
+            stdin=subprocess.PIPE,
+            creationflags=_NO_WINDOW
+        )
+    except OSError as e:
+        logger.debug(f"Dialog spawn failed ({command}): {e}")
+        return None
+
+
+def send_dialog_payload(proc: subprocess.Popen, data: dict):
+    """Hand a process from start_dialog its payload without waiting for the dialog to close"""
+    try:
+        # Only blocks until the child reads stdin (after its imports), not
+        # until the dialog closes
+        proc.stdin.write(_dumps(data))
+        proc.stdin.close()
+    except OSError as e:
+        logger.debug(f"Dialog payload not delivered: {e}")
+
+
+def show_dialog(command: str, data: dict):
+    """Show a dialog that returns nothing (viewers, toasts) without waiting for it to close"""
+    proc = start_dialog(command)
+    if proc:
+        send_dialog_payload(proc, data)
+
+
+def show_notification(title: str, message: str, duration: int = 3000):
+    """
+    Show a notification without blocking the caller.
+    
+    Uses a native Windows toast when WinRT is installed, otherwise the
+    ui/dialogs.py toast in a short-lived process.
+    """
+    if _show_native_toast(title, message):
+        return
+        
+    show_dialog("show_notification", {
+        "title": title,
+        "message": message,
+        "duration": duration
+    })
+
+
+class DialogClient:
+    """
+    Keeps one `dialogs.py --serve` process alive and sends it dialog requests.
+
+    Requests are serialized with a lock (there is only one dialog process, and
+    only one dialog should be on screen at a time). If the helper dies or
+    misbehaves, the request is retried in a one-shot process and the helper
+    is restarted on the next call.
+    """
+
+    _instance: Optional["DialogClient"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "DialogClient":
+        """Get the shared client"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def call(self, command: str, data: dict) -> Optional[dict]:
+        """Show a dialog and return its reply (None when cancelled or on error)"""
+        with self._lock:
+            try:
+                message = self._request(command, data)
+            except (OSError, EOFError, pickle.UnpicklingError) as e:
+                logger.warning(f"Dialog server failed ({command}): {e}, using one-shot dialog")
+                self._stop()
+            else:
+                # The dialog itself failed; the server is fine, so keep it
+                if not message.get("ok"):
+                    logger.error(f"Dialog error ({command}): {message.get('error', 'unknown dialog error')}")
+                    return None
+                return message.get("reply")
+        return run_dialog_once(command, data)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the helper process if it isn't running"""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                dialog_command("--serve"),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=_NO_WINDOW
+            )
+            logger.info(f"Dialog server started (pid {self._proc.pid})")
+        return self._proc
+
+    def _request(self, command: str, data: dict) -> dict:
+        """Send one framed request and wait for the framed reply message"""
+        proc = self._ensure_started()
+
+        # Both ends are this app, so pickle rather than JSON for the framed messages
+        body = pickle.dumps({"command": command, "data": data}, protocol=pickle.HIGHEST_PROTOCOL)
+        proc.stdin.write(struct.pack(">I", len(body)) + body)
+        proc.stdin.flush()
+
+        header = proc.stdout.read(4)
+        if len(header) < 4:
+            raise EOFError("dialog server closed the pipe")
+        (length,) = struct.unpack(">I", header)
+        return pickle.loads(proc.stdout.read(length))
+
+    def _stop(self):
+        """Kill the helper process so the next call starts a fresh one"""
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except OSError:
+                pass
+            self._proc = None
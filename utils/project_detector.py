@@ -79,7 +79,7 @@ def get_dev_command(project_path: Path) -> list[str] | None:
     return None
 
 
-def get_active_project_path() -> Path | None:
+def get_active_project_path(hint: Path | None = None) -> Path | None:
     """
     Try to detect the active project path from the foreground window.
     
@@ -87,6 +87,9 @@ def get_active_project_path() -> Path | None:
     - VS Code: Extracts folder name from window title
     - Windows Explorer: Gets current folder path
     - Falls back to None if detection fails
+    
+    hint is a previously used project folder; if the window shows a folder
+    with the same name it is returned without searching the disk.
     """
     try:
         import win32gui
@@ -112,6 +115,10 @@ def get_active_project_path() -> Path | None:
                 # Folder is usually the second-to-last part before "Visual Studio Code"
                 folder_name = parts[-2].strip()
                 
+                if hint is not None and hint.name == folder_name:
+                    logger.info(f"Detected project from VS Code (last used): {hint}")
+                    return hint
+                
                 # Search common development directories for this folder
                 search_paths = [
                     Path.home() / "Documents" / "GitHub",